@@ -1,5 +1,5 @@
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import httpx
 from jose import jwt, jwk
 from jose.utils import base64url_decode
@@ -14,6 +14,7 @@ ALGORITHMS = os.environ.get("AUTH0_ALGORITHMS", "RS256").split(",")
 _JWKS_CACHE: Dict[str, Any] = {}
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 def _get_jwks():
     global _JWKS_CACHE
@@ -105,6 +106,16 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
         roles = [roles]
     return {"sub": sub, "roles": roles, "raw": payload}
 
+def get_optional_user(credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)):
+    # public endpoints: an absent or unusable token just means an anonymous reader.
+    # A token here costs a JWKS fetch (up to 5s) on the first request until _JWKS_CACHE is filled.
+    if not credentials:
+        return None
+    try:
+        return get_current_user(credentials)
+    except Exception:
+        return None
+
 def require_roles(*allowed_roles: str):
     def _checker(user=Depends(get_current_user)):
         user_roles = set([r.upper() for r in user.get("roles", [])])
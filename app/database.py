@@ -1,12 +1,152 @@
 from sqlmodel import SQLModel, create_engine, Session
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+from fastapi import Depends
+from typing import Dict, List, Optional
+from app.auth import get_current_user, get_optional_user
 import os
+import threading
+import time
 
 DB_URL = os.environ.get("DATABASE_URL", "sqlite:///./app.db")
-engine = create_engine(DB_URL, connect_args={"check_same_thread": False} if DB_URL.startswith("sqlite") else {})
+REPLICA_URLS = [u.strip() for u in os.environ.get("DATABASE_REPLICA_URLS", "").split(",") if u.strip()]
+# how long (seconds) a user keeps reading from the primary after writing
+READ_YOUR_WRITES_SECONDS = float(os.environ.get("READ_YOUR_WRITES_SECONDS", "5"))
+REPLICA_HEALTH_INTERVAL = float(os.environ.get("REPLICA_HEALTH_INTERVAL", "10"))
+REPLICA_RETRY_SECONDS = float(os.environ.get("REPLICA_RETRY_SECONDS", "30"))
+REPLICA_CONNECT_TIMEOUT = int(os.environ.get("REPLICA_CONNECT_TIMEOUT", "2"))
+
+
+def _make_engine(url: str, replica: bool = False):
+    if url.startswith("sqlite"):
+        return create_engine(url, connect_args={"check_same_thread": False})
+    if replica:
+        # an unreachable replica must fail fast so reads can fall back to the primary
+        return create_engine(url, pool_pre_ping=True, connect_args={"connect_timeout": REPLICA_CONNECT_TIMEOUT})
+    return create_engine(url)
+
+
+engine = _make_engine(DB_URL)
+
+
+class ReplicaPool:
+    """Round-robin over read replicas, skipping the ones that fail a health check."""
+
+    def __init__(self, urls: List[str]):
+        self.engines = [_make_engine(u, replica=True) for u in urls]
+        self._next = 0
+        self._checked_at: Dict[int, float] = {}
+        self._down_until: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def _probe(self, idx: int) -> bool:
+        # runs without the lock so a slow replica doesn't stall every other read
+        try:
+            with self.engines[idx].connect() as conn:
+                conn.execute(text("SELECT 1"))
+        except Exception:
+            self.mark_down(idx)
+            return False
+        with self._lock:
+            self._checked_at[idx] = time.monotonic()
+            self._down_until.pop(idx, None)
+        return True
+
+    def mark_down(self, idx: int):
+        with self._lock:
+            self._down_until[idx] = time.monotonic() + REPLICA_RETRY_SECONDS
+            self._checked_at.pop(idx, None)
+
+    def choose(self):
+        """Return (index, engine) of the next healthy replica, or (None, None) if every replica is down."""
+        for _ in range(len(self.engines)):
+            with self._lock:
+                idx = self._next
+                self._next = (self._next + 1) % len(self.engines)
+                now = time.monotonic()
+                if self._down_until.get(idx, 0) > now:
+                    continue
+                fresh = now - self._checked_at.get(idx, float("-inf")) < REPLICA_HEALTH_INTERVAL
+            if fresh or self._probe(idx):
+                return idx, self.engines[idx]
+        return None, None
+
+
+replicas = ReplicaPool(REPLICA_URLS)
+
+
+class ReadSession(Session):
+    """Session bound to a replica that falls back to the primary when a query fails there."""
+
+    def __init__(self, replica_idx: Optional[int] = None, **kw):
+        super().__init__(**kw)
+        self.replica_idx = replica_idx
+
+    def _with_failover(self, run):
+        try:
+            return run()
+        except DBAPIError:
+            if self.replica_idx is None:
+                raise
+            replicas.mark_down(self.replica_idx)
+            self.replica_idx = None
+            self.rollback()
+            self.bind = engine
+            return run()
+
+    # sqlmodel's exec() calls SQLAlchemy's execute() directly, so both need wrapping
+    def exec(self, statement, *args, **kw):
+        return self._with_failover(lambda: super(ReadSession, self).exec(statement, *args, **kw))
+
+    def execute(self, statement, *args, **kw):
+        return self._with_failover(lambda: super(ReadSession, self).execute(statement, *args, **kw))
+
+
+_recent_writes: Dict[str, float] = {}
+_recent_writes_lock = threading.Lock()
+
+
+def mark_write(sub: str):
+    now = time.monotonic()
+    with _recent_writes_lock:
+        # prune here so users who never read again don't stay in the dict forever
+        for expired in [s for s, until in _recent_writes.items() if until <= now]:
+            del _recent_writes[expired]
+        _recent_writes[sub] = now + READ_YOUR_WRITES_SECONDS
+
+
+def wrote_recently(sub: Optional[str]) -> bool:
+    if not sub:
+        return False
+    with _recent_writes_lock:
+        until = _recent_writes.get(sub)
+        if until is None:
+            return False
+        if until <= time.monotonic():
+            del _recent_writes[sub]
+            return False
+        return True
+
 
 def init_db():
     SQLModel.metadata.create_all(engine)
+    # SQLite files used as local replica stand-ins need the schema too
+    for idx, replica_engine in enumerate(replicas.engines):
+        if str(replica_engine.url).startswith("sqlite"):
+            try:
+                SQLModel.metadata.create_all(replica_engine)
+            except Exception:
+                replicas.mark_down(idx)
 
-def get_session():
+def get_write_session(user=Depends(get_current_user)):
+    # commits pin the user to the primary so they read their own writes
     with Session(engine) as session:
+        event.listen(session, "after_commit", lambda s: mark_write(user["sub"]))
+        yield session
+
+def get_read_session(user=Depends(get_optional_user)):
+    idx, read_engine = None, None
+    if not wrote_recently(user["sub"] if user else None):
+        idx, read_engine = replicas.choose()
+    with ReadSession(replica_idx=idx, bind=read_engine or engine) as session:
         yield session
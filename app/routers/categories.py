@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select
-from app.database import get_session
+from app.database import get_read_session, get_write_session
 from app import models
 from app.auth import require_roles, get_current_user
 
@@ -8,7 +8,7 @@ router = APIRouter(prefix="/categories", tags=["categories"])
 
 
 @router.post("", dependencies=[Depends(require_roles("ADMIN"))])
-def create_category(name: str, session: Session = Depends(get_session)):
+def create_category(name: str, session: Session = Depends(get_write_session)):
     existing = session.exec(select(models.Category).where(models.Category.name == name)).first()
     if existing:
         raise HTTPException(status_code=400, detail="Categoria existente")
@@ -20,7 +20,7 @@ def create_category(name: str, session: Session = Depends(get_session)):
 
 
 @router.put("/{category_id}", dependencies=[Depends(require_roles("ADMIN"))])
-def update_category(category_id: int, name: str, session: Session = Depends(get_session)):
+def update_category(category_id: int, name: str, session: Session = Depends(get_write_session)):
     cat = session.get(models.Category, category_id)
     if not cat:
         raise HTTPException(status_code=404, detail="Não localizado")
@@ -32,7 +32,7 @@ def update_category(category_id: int, name: str, session: Session = Depends(get_
 
 
 @router.delete("/{category_id}", dependencies=[Depends(require_roles("ADMIN"))])
-def delete_category(category_id: int, session: Session = Depends(get_session)):
+def delete_category(category_id: int, session: Session = Depends(get_write_session)):
     cat = session.get(models.Category, category_id)
     if not cat:
         raise HTTPException(status_code=404, detail="Não localizado")
@@ -43,6 +43,6 @@ def delete_category(category_id: int, session: Session = Depends(get_session)):
 
 @router.get(""
 )
-def list_categories(session: Session = Depends(get_session)):
+def list_categories(session: Session = Depends(get_read_session)):
     cats = session.exec(select(models.Category)).all()
     return [{"id": c.id, "name": c.name} for c in cats]
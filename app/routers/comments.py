@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlmodel import Session, select
-from app.database import get_session
+from app.database import get_read_session, get_write_session
 from app import models, schemas
 from app.auth import get_current_user
 from typing import List
@@ -10,7 +10,7 @@ router = APIRouter(tags=["comments"])
 
 
 @router.get("/posts/{post_id}/comments", response_model=List[schemas.CommentRead])
-def list_comments(post_id: int, limit: int = Query(10, ge=1), offset: int = Query(0, ge=0), session: Session = Depends(get_session)):
+def list_comments(post_id: int, limit: int = Query(10, ge=1), offset: int = Query(0, ge=0), session: Session = Depends(get_read_session)):
     post = session.get(models.Post, post_id)
     if not post:
         raise HTTPException(status_code=404, detail="Post não localizado")
@@ -26,7 +26,7 @@ def list_comments(post_id: int, limit: int = Query(10, ge=1), offset: int = Quer
 
 
 @router.post("/posts/{post_id}/comments", response_model=schemas.CommentRead)
-def create_comment(post_id: int, payload: schemas.CommentCreate, user=Depends(get_current_user), session: Session = Depends(get_session)):
+def create_comment(post_id: int, payload: schemas.CommentCreate, user=Depends(get_current_user), session: Session = Depends(get_write_session)):
     post = session.get(models.Post, post_id)
     if not post:
         raise HTTPException(status_code=404, detail="Post não localizado")
@@ -39,7 +39,7 @@ def create_comment(post_id: int, payload: schemas.CommentCreate, user=Depends(ge
 
 
 @router.patch("/comments/{comment_id}/hide")
-def hide_comment(comment_id: int, user=Depends(get_current_user), session: Session = Depends(get_session)):
+def hide_comment(comment_id: int, user=Depends(get_current_user), session: Session = Depends(get_write_session)):
     roles = [r.upper() for r in (user.get("roles") or [])]
     if not ("MODERATOR" in roles or "ADMIN" in roles):
         raise HTTPException(status_code=403, detail="Permissão faltando")
@@ -53,7 +53,7 @@ def hide_comment(comment_id: int, user=Depends(get_current_user), session: Sessi
 
 
 @router.delete("/comments/{comment_id}")
-def delete_comment(comment_id: int, user=Depends(get_current_user), session: Session = Depends(get_session)):
+def delete_comment(comment_id: int, user=Depends(get_current_user), session: Session = Depends(get_write_session)):
     comment = session.get(models.Comment, comment_id)
     if not comment:
         raise HTTPException(status_code=404, detail="Comentário não localizado")
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select
-from app.database import get_session
+from app.database import get_write_session
 from app import models
 from app.auth import get_current_user
 from sqlalchemy import func
@@ -9,7 +9,7 @@ router = APIRouter(tags=["likes"])
 
 
 @router.post("/posts/{post_id}/like")
-def like_post(post_id: int, user=Depends(get_current_user), session: Session = Depends(get_session)):
+def like_post(post_id: int, user=Depends(get_current_user), session: Session = Depends(get_write_session)):
     post = session.get(models.Post, post_id)
     if not post:
         raise HTTPException(status_code=404, detail="Post não localizado")
@@ -24,7 +24,7 @@ def like_post(post_id: int, user=Depends(get_current_user), session: Session = D
 
 
 @router.post("/comments/{comment_id}/like")
-def like_comment(comment_id: int, user=Depends(get_current_user), session: Session = Depends(get_session)):
+def like_comment(comment_id: int, user=Depends(get_current_user), session: Session = Depends(get_write_session)):
     comment = session.get(models.Comment, comment_id)
     if not comment:
         raise HTTPException(status_code=404, detail="Comentário não localizado")
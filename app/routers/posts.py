@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
 from sqlmodel import select, Session
-from app.database import get_session
+from app.database import get_read_session, get_write_session
 from app import models
 from app import schemas
 from app.auth import get_current_user, require_roles
@@ -11,7 +11,7 @@ router = APIRouter(prefix="/posts", tags=["posts"])
 
 
 @router.post("", response_model=schemas.PostRead)
-def create_post(payload: schemas.PostCreate, user=Depends(get_current_user), session: Session = Depends(get_session)):
+def create_post(payload: schemas.PostCreate, user=Depends(get_current_user), session: Session = Depends(get_write_session)):
     category_obj = None
     if payload.category:
         stmt = select(models.Category).where(models.Category.name == payload.category)
@@ -43,7 +43,7 @@ def create_post(payload: schemas.PostCreate, user=Depends(get_current_user), ses
 
 
 @router.get("", response_model=List[schemas.PostRead])
-def list_posts(limit: int = Query(10, ge=1), offset: int = Query(0, ge=0), category: Optional[str] = None, tag: Optional[str] = None, author: Optional[str] = None, order_by: Optional[str] = Query("created_at"), session: Session = Depends(get_session)):
+def list_posts(limit: int = Query(10, ge=1), offset: int = Query(0, ge=0), category: Optional[str] = None, tag: Optional[str] = None, author: Optional[str] = None, order_by: Optional[str] = Query("created_at"), session: Session = Depends(get_read_session)):
     stmt = select(models.Post)
     if category:
         stmt = stmt.join(models.Category).where(models.Category.name == category)
@@ -67,7 +67,7 @@ def list_posts(limit: int = Query(10, ge=1), offset: int = Query(0, ge=0), categ
 
 
 @router.get("/search", response_model=List[schemas.PostRead])
-def search_posts(q: str, limit: int = 10, offset: int = 0, session: Session = Depends(get_session)):
+def search_posts(q: str, limit: int = 10, offset: int = 0, session: Session = Depends(get_read_session)):
     stmt = select(models.Post).where((models.Post.title.ilike(f"%{q}%")) | (models.Post.content.ilike(f"%{q}%"))).order_by(models.Post.created_at.desc())
     posts = session.exec(stmt.offset(offset).limit(limit)).all()
     results = []
@@ -78,7 +78,7 @@ def search_posts(q: str, limit: int = 10, offset: int = 0, session: Session = De
 
 
 @router.put("/{post_id}", response_model=schemas.PostRead)
-def update_post(post_id: int, payload: schemas.PostCreate, user=Depends(get_current_user), session: Session = Depends(get_session)):
+def update_post(post_id: int, payload: schemas.PostCreate, user=Depends(get_current_user), session: Session = Depends(get_write_session)):
     post = session.get(models.Post, post_id)
     if not post:
         raise HTTPException(status_code=404, detail="Post não localizado")
@@ -115,7 +115,7 @@ def update_post(post_id: int, payload: schemas.PostCreate, user=Depends(get_curr
 
 
 @router.delete("/{post_id}")
-def delete_post(post_id: int, user=Depends(get_current_user), session: Session = Depends(get_session)):
+def delete_post(post_id: int, user=Depends(get_current_user), session: Session = Depends(get_write_session)):
     post = session.get(models.Post, post_id)
     if not post:
         raise HTTPException(status_code=404, detail="Post não localizado")
@@ -0,0 +1,111 @@
+import os
+import types
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import auth, database
+from app.main import app
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = Clock()
+    monkeypatch.setattr(database, "time", types.SimpleNamespace(monotonic=c.monotonic))
+    return c
+
+
+def sqlite_urls(tmp_path, *names):
+    return [f"sqlite:///{tmp_path / n}" for n in names]
+
+
+def test_round_robin_across_replicas(tmp_path, clock):
+    pool = database.ReplicaPool(sqlite_urls(tmp_path, "r1.db", "r2.db", "r3.db"))
+    picked = [pool.choose()[0] for _ in range(6)]
+    assert picked == [0, 1, 2, 0, 1, 2]
+
+
+def test_unhealthy_replica_skipped_until_cooldown(tmp_path, clock, monkeypatch):
+    monkeypatch.setattr(database, "REPLICA_RETRY_SECONDS", 30)
+    urls = sqlite_urls(tmp_path, "r1.db") + [f"sqlite:///{tmp_path / 'missing' / 'r2.db'}"]
+    pool = database.ReplicaPool(urls)
+    assert [pool.choose()[0] for _ in range(3)] == [0, 0, 0]
+
+    # once the directory exists the replica is only tried again after the cooldown
+    (tmp_path / "missing").mkdir()
+    clock.now += 29
+    assert [pool.choose()[0] for _ in range(2)] == [0, 0]
+    clock.now += 2
+    assert sorted(pool.choose()[0] for _ in range(2)) == [0, 1]
+
+
+def test_all_replicas_down_returns_none(tmp_path, clock):
+    pool = database.ReplicaPool([f"sqlite:///{tmp_path / 'missing' / 'r.db'}"])
+    assert pool.choose() == (None, None)
+
+
+def test_read_your_writes_window(clock, monkeypatch):
+    monkeypatch.setattr(database, "READ_YOUR_WRITES_SECONDS", 5)
+    monkeypatch.setattr(database, "_recent_writes", {})
+    database.mark_write("u1")
+    assert database.wrote_recently("u1")
+    assert not database.wrote_recently("u2")
+    assert not database.wrote_recently(None)
+    clock.now += 5
+    assert not database.wrote_recently("u1")
+
+
+def test_mark_write_prunes_expired_entries(clock, monkeypatch):
+    monkeypatch.setattr(database, "READ_YOUR_WRITES_SECONDS", 5)
+    monkeypatch.setattr(database, "_recent_writes", {})
+    database.mark_write("u1")
+    clock.now += 10
+    database.mark_write("u2")
+    assert list(database._recent_writes) == ["u2"]
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setenv("TESTING", "1")
+    monkeypatch.setattr(database, "engine", database._make_engine(f"sqlite:///{tmp_path / 'primary.db'}"))
+    monkeypatch.setattr(database, "replicas", database.ReplicaPool(sqlite_urls(tmp_path, "r1.db", "r2.db")))
+    monkeypatch.setattr(database, "_recent_writes", {})
+    with TestClient(app) as c:
+        yield c
+
+
+def test_author_reads_own_post_anonymous_reads_replica(client):
+    author = {"Authorization": "Bearer test:u1|USER"}
+    resp = client.post("/posts", json={"title": "t", "content": "c", "tags": []}, headers=author)
+    assert resp.status_code == 200
+
+    assert len(client.get("/posts", headers=author).json()) == 1
+    # the SQLite stand-ins are not replicated, so anonymous readers see nothing yet
+    assert client.get("/posts").json() == []
+
+
+def test_malformed_token_on_public_read_is_anonymous(client, monkeypatch):
+    monkeypatch.setattr(auth, "AUTH0_DOMAIN", "example.auth0.com")
+    monkeypatch.setattr(auth, "_JWKS_CACHE", {"keys": [{"kid": "k"}]})
+    resp = client.get("/posts", headers={"Authorization": "Bearer garbage"})
+    assert resp.status_code == 200
+
+
+def test_failed_replica_query_falls_back_to_primary(client, tmp_path):
+    client.post("/categories", params={"name": "x"}, headers={"Authorization": "Bearer test:a|ADMIN"})
+    database._recent_writes.clear()
+
+    # replicas still pass SELECT 1 but lose their tables
+    for name in ("r1.db", "r2.db"):
+        os.remove(tmp_path / name)
+    resp = client.get("/categories")
+    assert resp.status_code == 200
+    assert resp.json() == [{"id": 1, "name": "x"}]